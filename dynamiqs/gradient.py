@@ -4,7 +4,7 @@ import equinox as eqx
 
 from ._utils import tree_str_inline
 
-__all__ = ['Autograd', 'CheckpointAutograd', 'ForwardAutograd']
+__all__ = ['Autograd', 'BacksolveAutograd', 'CheckpointAutograd', 'ForwardAutograd']
 
 
 class Gradient(eqx.Module):
@@ -62,7 +62,10 @@ class CheckpointAutograd(Gradient):
             `None` by default, in which case it will be set to `log(max_steps)`,
             for which a theoretical result is available guaranteeing that
             backpropagation will take `O(n_steps log(n_steps))` time in the number
-            of steps `n_steps <= max_steps`.
+            of steps `n_steps <= max_steps`. If it is set to at least `n_steps`,
+            every step is stored and nothing is recomputed during backpropagation,
+            which is the fastest option when memory allows it (typically for fixed
+            step methods with few steps).
     """
 
     ncheckpoints: int | None = None
@@ -108,3 +111,39 @@ class ForwardAutograd(Gradient):
     # dummy init to have the signature in the documentation
     def __init__(self):
         pass
+
+
+class BacksolveAutograd(Gradient):
+    """Continuous adjoint method.
+
+    With this option, the gradient is computed by solving the adjoint differential
+    equation backward in time, instead of differentiating through the internals of
+    the solver. The memory usage is constant in the number of steps, which makes it
+    suitable for long integrations of stiff problems.
+
+    Warning:
+        The computed gradient is only an approximation of the gradient of the
+        numerical solution, with an error controlled by the tolerances of the
+        backward solve. Prefer
+        [`dq.gradient.CheckpointAutograd`][dynamiqs.gradient.CheckpointAutograd] if
+        exact gradients are needed.
+
+    Note:
+        For Diffrax-based methods, this falls back to the
+        [`diffrax.BacksolveAdjoint`](https://docs.kidger.site/diffrax/api/adjoints/#diffrax.BacksolveAdjoint)
+        option, with the same solver as the forward solve.
+
+    Args:
+        rtol: Relative tolerance of the backward solve. Defaults to the relative
+            tolerance of the method if `None`.
+        atol: Absolute tolerance of the backward solve. Defaults to the absolute
+            tolerance of the method if `None`.
+    """
+
+    rtol: float | None = None
+    atol: float | None = None
+
+    # dummy init to have the signature in the documentation
+    def __init__(self, rtol: float | None = None, atol: float | None = None):
+        self.rtol = rtol
+        self.atol = atol
@@ -1,25 +1,32 @@
 from __future__ import annotations
 
+import itertools
+import math
 from functools import partial
 from typing import Any
 
+import equinox as eqx
 import jax
 import jax.numpy as jnp
 from jax import Array
-from jaxtyping import ArrayLike, PRNGKeyArray
+from jax.sharding import Mesh, NamedSharding
+from jax.sharding import PartitionSpec as P
+from jaxtyping import ArrayLike, PRNGKeyArray, PyTree
 
-from ..._checks import check_shape, check_times
+from ..._checks import _has_shape, check_shape, check_times
 from ...gradient import Gradient
 from ...method import Dopri5, Dopri8, Euler, Event, Kvaerno3, Kvaerno5, Method, Tsit5
 from ...options import Options, check_options
+from ...progress_meter import NoProgressMeter
+from ...qarrays.dense_qarray import DenseQArray
 from ...qarrays.qarray import QArray, QArrayLike
-from ...qarrays.utils import asqarray
+from ...qarrays.utils import asqarray, stack
 from ...result import JSSESolveResult
 from ...time_qarray import TimeQArray
+from ...utils.global_settings import _matmul_precision_context
 from .._utils import (
     assert_method_supported,
     astimeqarray,
-    cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
 )
@@ -32,6 +39,17 @@ from ..core.event_integrator import (
     jssesolve_event_tsit5_integrator_constructor,
 )
 
+# integrator constructors for the `Event` method, selected from the type of its
+# no-click method
+_INTEGRATOR_CONSTRUCTORS: dict[type[Method], callable] = {
+    Euler: jssesolve_event_euler_integrator_constructor,
+    Dopri5: jssesolve_event_dopri5_integrator_constructor,
+    Dopri8: jssesolve_event_dopri8_integrator_constructor,
+    Tsit5: jssesolve_event_tsit5_integrator_constructor,
+    Kvaerno3: jssesolve_event_kvaerno3_integrator_constructor,
+    Kvaerno5: jssesolve_event_kvaerno5_integrator_constructor,
+}
+
 
 def jssesolve(
     H: QArrayLike | TimeQArray,
@@ -109,7 +127,7 @@ def jssesolve(
             method-dependent, refer to the documentation of the chosen method for more
             details.
         options: Generic options (supported: `save_states`, `cartesian_batching`, `t0`,
-            `save_extra`, `nmaxclick`).
+            `save_extra`, `nmaxclick`, `device_sharding`, `matmul_precision`).
             ??? "Detailed options API"
                 ```
                 dq.Options(
@@ -118,6 +136,8 @@ def jssesolve(
                     t0: ScalarLike | None = None,
                     save_extra: callable[[Array], PyTree] | None = None,
                     nmaxclick: int = 10_000,
+                    device_sharding: bool = False,
+                    matmul_precision: Literal['low', 'high', 'highest'] | None = None,
                 )
                 ```
 
@@ -136,6 +156,18 @@ def jssesolve(
                     during the integration, accessible in `result.extra`.
                 - **nmaxclick** - Maximum buffer size for `result.clicktimes`, should be
                     set higher than the expected maximum number of clicks.
+                - **device_sharding** - If `True`, the trajectories are split evenly
+                    across all available devices (e.g. multiple GPUs) and integrated in
+                    parallel. The number of click trajectories, `len(keys)` or
+                    `len(keys) - 1` with smart sampling, must be a multiple of the
+                    number of devices. The global progress meter is
+                    disabled for sharded solves, as its host callback can not be
+                    partitioned across devices.
+                - **matmul_precision** - Precision of the matrix multiplications on
+                    GPUs and TPUs for this solve, either `'low'`, `'high'` or
+                    `'highest'`, see
+                    [`dq.set_matmul_precision()`][dynamiqs.set_matmul_precision]. If
+                    `None`, the global setting is used.
 
     Returns:
         `dq.JSSESolveResult` object holding the result of the jump SSE integration. Use
@@ -194,6 +226,15 @@ def jssesolve(
     [Time-dependent operators](../../documentation/basics/time-dependent-operators.md)
     tutorial for more details.
 
+    ## Choosing the layout of the operators
+
+    The Hamiltonian, the jump operators and the observables are integrated in the
+    layout they are given in, by default the sparse DIA layout for the operators
+    built with dynamiqs (see [`dq.set_layout()`][dynamiqs.set_layout]). For small
+    Hilbert spaces, the dense layout can be faster. The expectation values of
+    observables all given in the dense layout are computed in a single batched
+    product.
+
     ## Running multiple simulations concurrently
 
     The Hamiltonian `H`, the jump operators `jump_ops` and the initial state `psi0` can
@@ -247,12 +288,21 @@ def jssesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'jssesolve')
     options = options.initialise()
+    assert_method_supported(method, (Event,))
+    method.assert_supports_gradient(gradient)
+    if options.device_sharding:
+        _check_device_sharding(keys, method)
+        # the progress meter host callback inside the sharded vmap forces XLA to
+        # gather the trajectories on a single device, so it is disabled
+        options = eqx.tree_at(lambda x: x.progress_meter, options, NoProgressMeter())
 
     # we implement the jitted vectorization in another function to pre-convert QuTiP
-    # objects (which are not JIT-compatible) to JAX arrays
-    return _vectorized_jssesolve(
-        H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options
-    )
+    # objects (which are not JIT-compatible) to JAX arrays, the matmul precision is
+    # set before calling it because it is read when the function is compiled
+    with _matmul_precision_context(options.matmul_precision):
+        return _vectorized_jssesolve(
+            H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options
+        )
 
 
 @catch_xla_runtime_error
@@ -268,7 +318,18 @@ def _vectorized_jssesolve(
     gradient: Gradient | None,
     options: Options,
 ) -> JSSESolveResult:
-    f = _vectorized_clicks_jssesolve
+    # === stack dense observables
+    # the expectation values of dense observables are computed at each save time in a
+    # single batched product rather than one product per observable
+    if exp_ops is not None and all(isinstance(E, DenseQArray) for E in exp_ops):
+        exp_ops = stack(exp_ops)  # (nE, n, n)
+
+    # === select integrator constructor
+    # the constructor is selected once here and closed over by the vectorized function
+    integrator_constructor = _select_integrator_constructor(method)
+    f = partial(
+        _vectorized_clicks_jssesolve, integrator_constructor=integrator_constructor
+    )
 
     # === vectorize function over H, Ls and psi0.
     # the result is vectorized over `_saved`, `infos` and `keys`
@@ -276,40 +337,119 @@ def _vectorized_jssesolve(
     in_axes = (H.in_axes, [L.in_axes for L in Ls], 0, *(None,) * 6)
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], psi0.ndim - 2, 0, 0, 0, 0, 0, 0)
-        f = cartesian_vmap(f, in_axes, out_axes, nvmap)
+        # flatten the cartesian product of all batch dimensions to a single batch axis,
+        # such that the function is vectorized with a single vmap instead of one vmap
+        # per batch dimension
+        bshapes = [x.shape[:-2] for x in [H, *Ls, psi0]]
+        bshape = tuple(itertools.chain.from_iterable(bshapes))
+        if len(bshape) > 0:
+            f = _gather_cartesian(f, [H, *Ls, psi0], [in_axes[0], *in_axes[1], 0])
+            in_axes = (0, *(None,) * 6)
+            idxs = [_cartesian_indices(bshapes, i) for i in range(len(bshapes))]
+            f = jax.vmap(f, in_axes, out_axes)
+            result = f(idxs, tsave, keys, exp_ops, method, gradient, options)
+            return _unflatten_batch(result, out_axes, bshape)
     else:
         bshape = jnp.broadcast_shapes(*[x.shape[:-2] for x in [H, *Ls, psi0]])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        n = H.shape[-1]
-        H = H.broadcast_to(*bshape, n, n)
-        Ls = [L.broadcast_to(*bshape, n, n) for L in Ls]
-        psi0 = psi0.broadcast_to(*bshape, n, 1)
+        H = _broadcast_batch(H, bshape)
+        Ls = [_broadcast_batch(L, bshape) for L in Ls]
+        psi0 = _broadcast_batch(psi0, bshape)
         # vectorize the function
         f = multi_vmap(f, in_axes, out_axes, nvmap)
 
     return f(H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options)
 
 
+def _cartesian_indices(bshapes: list[tuple[int, ...]], i: int) -> Array | None:
+    # index in the flattened batch dimensions `bshapes[i]` of the i-th argument for
+    # each element of the flattened cartesian product of all batch dimensions
+    # `(*bshapes[0], *bshapes[1], ...)`, or `None` if the argument is not batched
+    if len(bshapes[i]) == 0:
+        return None
+    ndim_before = sum(len(s) for s in bshapes[:i])
+    ndim_after = sum(len(s) for s in bshapes[i + 1 :])
+    bshape = tuple(itertools.chain.from_iterable(bshapes))
+    idxs = jnp.arange(math.prod(bshapes[i]))
+    idxs = idxs.reshape(*(1,) * ndim_before, *bshapes[i], *(1,) * ndim_after)
+    return jnp.broadcast_to(idxs, bshape).reshape(-1)
+
+
+def _gather_cartesian(
+    f: callable, xs: list[QArray | TimeQArray], xs_in_axes: list[PyTree]
+) -> callable:
+    # return `f` taking as first argument the indices of the arguments `H, *Ls, psi0`
+    # in their flattened batch dimensions, such that only the indices are broadcast to
+    # the cartesian product of all batch dimensions, and each argument is gathered
+    # inside the vectorized function rather than broadcast beforehand
+    xs = [x if len(x.shape) == 2 else x.reshape(-1, *x.shape[-2:]) for x in xs]
+
+    def take(x: QArray | TimeQArray, in_axes: PyTree, idx: Array | None) -> PyTree:
+        if idx is None:
+            return x
+        return jax.tree.map(
+            lambda axis, x: x if axis is None else jax.tree.map(lambda y: y[idx], x),
+            in_axes,
+            x,
+            is_leaf=lambda axis: axis is None,
+        )
+
+    def gathered_f(idxs: list[Array | None], *args: Any) -> JSSESolveResult:
+        H, *Ls, psi0 = [
+            take(x, in_axes, idx)
+            for x, in_axes, idx in zip(xs, xs_in_axes, idxs, strict=True)
+        ]
+        return f(H, Ls, psi0, *args)
+
+    return gathered_f
+
+
+def _broadcast_batch(
+    x: QArray | TimeQArray, bshape: tuple[int, ...]
+) -> QArray | TimeQArray:
+    # broadcast the batch dimensions of `x` to `bshape`, inputs already of the right
+    # shape are returned as is to avoid materializing a copy
+    if x.shape[:-2] == bshape:
+        return x
+    return x.broadcast_to(*bshape, *x.shape[-2:])
+
+
+def _unflatten_batch(
+    result: JSSESolveResult, out_axes: JSSESolveResult, bshape: tuple[int, ...]
+) -> JSSESolveResult:
+    # unflatten the single leading batch axis of the vectorized result fields
+    def _unflatten(path: tuple, leaf: Any) -> Any:
+        if getattr(out_axes, path[0].name) is None:
+            return leaf
+        else:
+            return leaf.reshape(*bshape, *leaf.shape[1:])
+
+    return jax.tree.map_with_path(_unflatten, result)
+
+
 def _vectorized_clicks_jssesolve(
     H: TimeQArray,
     Ls: list[TimeQArray],
     psi0: QArray,
     tsave: Array,
     keys: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: list[QArray] | QArray | None,
     method: Method,
     gradient: Gradient | None,
     options: Options,
+    *,
+    integrator_constructor: callable,
 ) -> JSSESolveResult:
-    f = _jssesolve_single_trajectory
+    f = partial(
+        _jssesolve_single_trajectory, integrator_constructor=integrator_constructor
+    )
 
     # === vectorize function over stochastic trajectories
     # the input is vectorized over `key`
     # the result is vectorized over `_saved`, `infos` and `keys`
     out_axes = JSSESolveResult.out_axes()
-    in_axes = (None, None, None, None, 0, None, None, None, None, None, None)
+    in_axes = (None, None, None, None, 0, None, None, None, None, None)
     f = jax.vmap(f, in_axes, out_axes)
 
     # === define common arguments
@@ -317,17 +457,38 @@ def _vectorized_clicks_jssesolve(
     other_args = (exp_ops, method, gradient, options)
 
     if method.smart_sampling:
-        # consume the first key for the no-click trajectory
-        noclick_args = (keys[0], True, 0.0)
-        noclick_result = _jssesolve_single_trajectory(
-            *core_args, *noclick_args, *other_args
+        # consume the first key for the no-click trajectory, integrated in a single
+        # solve to the final time
+        noclick_result = _jssesolve_noclick_trajectory(
+            *core_args,
+            keys[0],
+            *other_args,
+            integrator_constructor=integrator_constructor,
         )
 
         # consume the remaining keys for the click trajectories, using the norm of the
         # no-click state as the minimum value for random numbers triggering a click
-        click_args = (keys[1:], False, noclick_result.final_state_norm**2)
-        click_result = f(*core_args, *click_args, *other_args)
+        keys = keys[1:]
+        noclick_min_prob = noclick_result.final_state_norm**2
+    else:
+        noclick_min_prob = 0.0
+
+    if options.device_sharding:
+        # === shard trajectories across devices
+        # click trajectories are independent, so splitting `keys` across devices lets
+        # each device integrate its own block of trajectories, all other arguments
+        # being replicated, typed PRNG keys are sharded through their raw key data
+        mesh = Mesh(jax.devices(), ('traj',))
+        impl = jax.random.key_impl(keys)
+        keys = jax.random.key_data(keys)
+        keys = jax.lax.with_sharding_constraint(
+            keys, NamedSharding(mesh, P('traj', None))
+        )
+        keys = jax.random.wrap_key_data(keys, impl=impl)
 
+    click_result = f(*core_args, keys, noclick_min_prob, *other_args)
+
+    if method.smart_sampling:
         # concatenate the results of the no-click and click trajectories
         def _concatenate_results(path: tuple, leaf1: Any, leaf2: Any) -> Any:
             if getattr(out_axes, path[0].name) is None:
@@ -339,8 +500,7 @@ def _vectorized_clicks_jssesolve(
             _concatenate_results, noclick_result, click_result
         )
     else:
-        click_args = (keys, False, 0.0)
-        return f(*core_args, *click_args, *other_args)
+        return click_result
 
 
 def _jssesolve_single_trajectory(
@@ -349,33 +509,14 @@ def _jssesolve_single_trajectory(
     psi0: QArray,
     tsave: Array,
     key: PRNGKeyArray,
-    noclick: bool,
     noclick_min_prob: float,
-    exp_ops: list[QArray] | None,
+    exp_ops: list[QArray] | QArray | None,
     method: Method,
     gradient: Gradient | None,
     options: Options,
+    *,
+    integrator_constructor: callable,
 ) -> JSSESolveResult:
-    # === select integrator constructor
-    supported_methods = (Event,)
-    assert_method_supported(method, supported_methods)
-    if isinstance(method, Event):
-        integrator_constructors = {
-            Euler: jssesolve_event_euler_integrator_constructor,
-            Dopri5: jssesolve_event_dopri5_integrator_constructor,
-            Dopri8: jssesolve_event_dopri8_integrator_constructor,
-            Tsit5: jssesolve_event_tsit5_integrator_constructor,
-            Kvaerno3: jssesolve_event_kvaerno3_integrator_constructor,
-            Kvaerno5: jssesolve_event_kvaerno5_integrator_constructor,
-        }
-        integrator_constructor = integrator_constructors[type(method.noclick_method)]
-    else:
-        # temporary until we implement other methods
-        raise NotImplementedError
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
@@ -388,7 +529,6 @@ def _jssesolve_single_trajectory(
         Ls=Ls,
         Es=exp_ops,
         key=key,
-        noclick=noclick,
         noclick_min_prob=noclick_min_prob,
     )
 
@@ -399,6 +539,63 @@ def _jssesolve_single_trajectory(
     return result  # noqa: RET504
 
 
+def _jssesolve_noclick_trajectory(
+    H: TimeQArray,
+    Ls: list[TimeQArray],
+    psi0: QArray,
+    tsave: Array,
+    key: PRNGKeyArray,
+    exp_ops: list[QArray] | QArray | None,
+    method: Method,
+    gradient: Gradient | None,
+    options: Options,
+    *,
+    integrator_constructor: callable,
+) -> JSSESolveResult:
+    # === init integrator
+    integrator = integrator_constructor(
+        ts=tsave,
+        y0=psi0,
+        method=method,
+        gradient=gradient,
+        result_class=JSSESolveResult,
+        options=options,
+        H=H,
+        Ls=Ls,
+        Es=exp_ops,
+        key=key,
+        noclick_min_prob=0.0,
+    )
+
+    # === run integrator
+    result = integrator.run_noclick()
+
+    # === return result
+    return result  # noqa: RET504
+
+
+def _select_integrator_constructor(method: Method) -> callable:
+    if isinstance(method, Event):
+        return _INTEGRATOR_CONSTRUCTORS[type(method.noclick_method)]
+    else:
+        # temporary until we implement other methods
+        raise NotImplementedError
+
+
+def _check_device_sharding(keys: PRNGKeyArray, method: Method):
+    # with smart sampling, the first key is consumed by the no-click trajectory which
+    # is not sharded
+    ndevices = jax.device_count()
+    nclick = len(keys) - 1 if method.smart_sampling else len(keys)
+    if nclick % ndevices != 0:
+        keys_str = 'len(keys) - 1' if method.smart_sampling else 'len(keys)'
+        raise ValueError(
+            f'The number of click trajectories must be a multiple of the number of'
+            f' devices to shard trajectories with `options.device_sharding=True`, but'
+            f' got {keys_str}={nclick} for {ndevices} devices.'
+        )
+
+
 def _check_jssesolve_args(
     H: TimeQArray, Ls: list[TimeQArray], psi0: QArray, exp_ops: list[QArray] | None
 ):
@@ -406,8 +603,11 @@ def _check_jssesolve_args(
     check_shape(H, 'H', '(..., n, n)', subs={'...': '...H'})
 
     # === check Ls shape
-    for i, L in enumerate(Ls):
-        check_shape(L, f'jump_ops[{i}]', '(..., n, n)', subs={'...': f'...L{i}'})
+    # all shapes are checked in a single pass, the per-operator check and its error
+    # message are only built on failure
+    if not all(_has_shape(L, '(..., n, n)') for L in Ls):
+        for i, L in enumerate(Ls):
+            check_shape(L, f'jump_ops[{i}]', '(..., n, n)', subs={'...': f'...L{i}'})
 
     if len(Ls) == 0:
         raise ValueError(
@@ -419,6 +619,6 @@ def _check_jssesolve_args(
     check_shape(psi0, 'psi0', '(..., n, 1)', subs={'...': '...psi0'})
 
     # === check exp_ops shape
-    if exp_ops is not None:
+    if exp_ops is not None and not all(_has_shape(E, '(n, n)') for E in exp_ops):
         for i, E in enumerate(exp_ops):
             check_shape(E, f'exp_ops[{i}]', '(n, n)')
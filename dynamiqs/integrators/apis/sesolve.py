@@ -15,6 +15,7 @@ from ...qarrays.qarray import QArray, QArrayLike
 from ...qarrays.utils import asqarray
 from ...result import SESolveResult
 from ...time_qarray import TimeQArray
+from ...utils.global_settings import _matmul_precision_context
 from .._utils import (
     assert_method_supported,
     astimeqarray,
@@ -78,7 +79,7 @@ def sesolve(
             method-dependent, refer to the documentation of the chosen method for more
             details.
         options: Generic options (supported: `save_states`, `cartesian_batching`,
-            `progress_meter`, `t0`, `save_extra`).
+            `progress_meter`, `t0`, `save_extra`, `matmul_precision`).
             ??? "Detailed options API"
                 ```
                 dq.Options(
@@ -87,6 +88,7 @@ def sesolve(
                     progress_meter: AbstractProgressMeter | bool | None = None,
                     t0: ScalarLike | None = None,
                     save_extra: callable[[Array], PyTree] | None = None,
+                    matmul_precision: Literal['low', 'high', 'highest'] | None = None,
                 )
                 ```
 
@@ -112,6 +114,11 @@ def sesolve(
                     `f(QArray) -> PyTree` that takes a state as input and returns a
                     PyTree. This can be used to save additional arbitrary data
                     during the integration, accessible in `result.extra`.
+                - **matmul_precision** - Precision of the matrix multiplications on
+                    GPUs and TPUs for this solve, either `'low'`, `'high'` or
+                    `'highest'`, see
+                    [`dq.set_matmul_precision()`][dynamiqs.set_matmul_precision]. If
+                    `None`, the global setting is used.
 
     Returns:
         `dq.SESolveResult` object holding the result of the Schrödinger equation
@@ -200,8 +207,10 @@ def sesolve(
     options = options.initialise()
 
     # we implement the jitted vectorization in another function to pre-convert QuTiP
-    # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_sesolve(H, psi0, tsave, exp_ops, method, gradient, options)
+    # objects (which are not JIT-compatible) to qarrays, the matmul precision is set
+    # before calling it because it is read when the function is compiled
+    with _matmul_precision_context(options.matmul_precision):
+        return _vectorized_sesolve(H, psi0, tsave, exp_ops, method, gradient, options)
 
 
 @catch_xla_runtime_error
@@ -6,11 +6,16 @@ from functools import partial
 
 import diffrax as dx
 import equinox as eqx
+import jax
+import jax.numpy as jnp
+import jax.tree_util as jtu
+from equinox.internal import while_loop
 from jax import Array
 from jaxtyping import PyTree, Scalar
 
-from ..._utils import obj_type_str
-from ...gradient import Autograd, CheckpointAutograd, ForwardAutograd
+from ..._utils import concatenate_sort, obj_type_str
+from ...gradient import Autograd, BacksolveAutograd, CheckpointAutograd, ForwardAutograd
+from ...method import Euler
 from ...result import Result
 from ...utils.vectorization import slindbladian
 from .abstract_integrator import BaseIntegrator
@@ -46,6 +51,28 @@ class AdaptiveStepInfos(eqx.Module):
         )
 
 
+class _SplitComplex(eqx.Module):
+    real: Array
+    imag: Array
+
+
+def _split_complex(tree: PyTree) -> PyTree:
+    # replace the complex arrays of a pytree by their real and imaginary parts
+    def split(x: PyTree) -> PyTree:
+        if eqx.is_array(x) and jnp.iscomplexobj(x):
+            return _SplitComplex(x.real, x.imag)
+        return x
+
+    return jtu.tree_map(split, tree)
+
+
+def _merge_complex(tree: PyTree) -> PyTree:
+    # inverse of `_split_complex()`
+    is_split = lambda x: isinstance(x, _SplitComplex)
+    merge = lambda x: x.real + 1j * x.imag if is_split(x) else x
+    return jtu.tree_map(merge, tree, is_leaf=is_split)
+
+
 class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface):
     """Integrator using the Diffrax library."""
 
@@ -57,15 +84,18 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
         if self.fixed_step:
             return dx.ConstantStepSize()
         else:
-            jump_ts = None if len(self.discontinuity_ts) == 0 else self.discontinuity_ts
-            return dx.PIDController(
-                rtol=self.method.rtol,
-                atol=self.method.atol,
-                safety=self.method.safety_factor,
-                factormin=self.method.min_factor,
-                factormax=self.method.max_factor,
-                jump_ts=jump_ts,
-            )
+            return self.pid_controller(self.method.rtol, self.method.atol)
+
+    def pid_controller(self, rtol: float, atol: float) -> dx.PIDController:
+        jump_ts = None if len(self.discontinuity_ts) == 0 else self.discontinuity_ts
+        return dx.PIDController(
+            rtol=rtol,
+            atol=atol,
+            safety=self.method.safety_factor,
+            factormin=self.method.min_factor,
+            factormax=self.method.max_factor,
+            jump_ts=jump_ts,
+        )
 
     @property
     def dt0(self) -> float | None:
@@ -81,6 +111,14 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
     def terms(self) -> dx.AbstractTerm:
         pass
 
+    @property
+    @abstractmethod
+    def args(self) -> PyTree:
+        # operators passed to the vector field of `terms`, they must not be closed
+        # over by the vector field for `diffrax.BacksolveAdjoint` to differentiate
+        # with respect to them
+        pass
+
     @property
     def adjoint(self) -> dx.AbstractAdjoint:
         if self.gradient is None:
@@ -91,6 +129,17 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
             return dx.ForwardMode()
         elif isinstance(self.gradient, Autograd):
             return dx.DirectAdjoint()
+        elif isinstance(self.gradient, BacksolveAutograd):
+            # the backward solve uses the forward solver, with the method tolerances
+            # unless overridden
+            rtol = self.gradient.rtol
+            rtol = rtol if rtol is not None else self.method.rtol
+            atol = self.gradient.atol
+            atol = atol if atol is not None else self.method.atol
+            return dx.BacksolveAdjoint(
+                solver=self.diffrax_solver,
+                stepsize_controller=self.pid_controller(rtol, atol),
+            )
         else:
             raise TypeError(f'Unknown gradient type {obj_type_str(self.gradient)}.')
 
@@ -101,19 +150,26 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
         y0: PyTree,
         saveat: dx.SaveAt,
         event: dx.Event | None = None,
+        *,
+        terms: dx.AbstractTerm | None = None,
+        args: PyTree = None,
     ) -> dx.Solution:
+        terms = self.terms if terms is None else terms
+        args = self.args if args is None else args
+
         with warnings.catch_warnings():
             # TODO: remove once complex support is stabilized in diffrax
             warnings.simplefilter('ignore', UserWarning)
 
             # === solve differential equation with diffrax
             return dx.diffeqsolve(
-                self.terms,
+                terms,
                 self.diffrax_solver,
                 t0=t0,
                 t1=t1,
                 dt0=self.dt0,
                 y0=y0,
+                args=args,
                 saveat=saveat,
                 stepsize_controller=self.stepsize_controller,
                 adjoint=self.adjoint,
@@ -123,6 +179,12 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
             )
 
     def run(self) -> Result:
+        if isinstance(self.method, Euler) and self.method.use_scan:
+            return self._run_euler_scan()
+
+        if isinstance(self.gradient, BacksolveAutograd):
+            return self._run_backsolve()
+
         # === prepare diffrax arguments
         fn = lambda t, y, args: self.save(y)  # noqa: ARG005
         subsaveat_a = dx.SubSaveAt(ts=self.ts, fn=fn)  # save solution regularly
@@ -136,6 +198,84 @@ class DiffraxIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface
         saved = self.postprocess_saved(*solution.ys)
         return self.result(saved, infos=self.infos(solution.stats))
 
+    def _run_backsolve(self) -> Result:
+        # `diffrax.BacksolveAdjoint` computes wrong gradients for complex states, so
+        # the state and the operators are split into their real and imaginary parts
+        vector_field = self.terms.vector_field
+
+        def split_vector_field(t, y, args):  # noqa: ANN001, ANN202
+            y, args = _merge_complex(y), _merge_complex(args)
+            return _split_complex(vector_field(t, y, args))
+
+        terms = dx.ODETerm(split_vector_field)
+        y0, args = _split_complex(self.y0), _split_complex(self.args)
+
+        # `diffrax.BacksolveAdjoint` only supports saving the raw solution, so the
+        # states are saved at all times and processed afterwards
+        saveat = dx.SaveAt(ts=self.ts)
+
+        # === solve differential equation
+        solution = self.diffeqsolve(
+            self.t0, self.t1, y0, saveat, terms=terms, args=args
+        )
+
+        # === collect and return results
+        ys = _merge_complex(solution.ys)  # the last saved state is at t1
+        saved = self.postprocess_saved(jax.vmap(self.save)(ys), ys[-1][None])
+        return self.result(saved, infos=self.infos(solution.stats))
+
+    def _run_euler_scan(self) -> Result:
+        # === find all times at which to stop in [t0, t1]
+        times = concatenate_sort(jnp.asarray([self.t0]), self.ts)  # (ntimes,)
+
+        # === integrate between consecutive times with fixed Euler steps
+        def step(carry: PyTree, x: tuple[Array, Array]) -> tuple[PyTree, PyTree]:
+            y, nsteps = self._euler_integrate(*x, carry)
+            return y, (self.save(y), nsteps)
+
+        ylast, (saved, nsteps) = jax.lax.scan(step, self.y0, (times[:-1], times[1:]))
+
+        # === collect and return results
+        saved = self.postprocess_saved(saved, ylast[None])
+        return self.result(saved, infos=FixedStepInfos(nsteps.sum()))
+
+    def _euler_integrate(
+        self, t0: Array, t1: Array, y0: PyTree
+    ) -> tuple[PyTree, Array]:
+        vector_field = self.terms.vector_field
+        dt = self.method.dt
+
+        # steps of size dt starting from t0, the last step is clipped to end at t1 (a
+        # small tolerance avoids a spurious tiny last step due to rounding errors)
+        nsteps = jnp.ceil((t1 - t0) / dt - 1e-6).astype(int)
+
+        def cond_fun(carry: tuple[Array, PyTree]) -> Array:
+            return carry[0] < nsteps
+
+        def body_fun(carry: tuple[Array, PyTree]) -> tuple[Array, PyTree]:
+            i, y = carry
+            t = t0 + i * dt
+            h = jnp.where(i == nsteps - 1, t1 - t, dt)
+            return i + 1, y + h * vector_field(t, y, self.args)
+
+        # the number of steps is not known at compile time, the loop is made
+        # reverse-mode differentiable similarly to the diffrax adjoints
+        if self.gradient is None or isinstance(self.gradient, ForwardAutograd):
+            kwargs = dict(kind='lax')
+        elif isinstance(self.gradient, CheckpointAutograd):
+            kwargs = dict(
+                kind='checkpointed',
+                checkpoints=self.gradient.ncheckpoints,
+                max_steps=self.max_steps,
+            )
+        elif isinstance(self.gradient, Autograd):
+            kwargs = dict(kind='bounded', max_steps=self.max_steps)
+        else:
+            raise TypeError(f'Unknown gradient type {obj_type_str(self.gradient)}.')
+
+        _, y = while_loop(cond_fun, body_fun, (0, y0), **kwargs)
+        return y, nsteps
+
     def infos(self, stats: dict[str, Array]) -> PyTree:
         if self.fixed_step:
             return FixedStepInfos(stats['num_steps'])
@@ -153,9 +293,13 @@ class SEDiffraxIntegrator(DiffraxIntegrator, SEInterface):
     @property
     def terms(self) -> dx.AbstractTerm:
         # define Schrödinger term d|psi>/dt = - i H |psi>
-        vector_field = lambda t, y, _: -1j * self.H(t) @ y
+        vector_field = lambda t, y, H: -1j * H(t) @ y
         return dx.ODETerm(vector_field)
 
+    @property
+    def args(self) -> PyTree:
+        return self.H
+
 
 class SEPropagatorDiffraxIntegrator(SEDiffraxIntegrator, PropagatorSaveMixin):
     """Integrator computing the propagator of the Schrödinger equation using the Diffrax
@@ -212,6 +356,10 @@ sesolve_kvaerno5_integrator_constructor = partial(
 class MEDiffraxIntegrator(DiffraxIntegrator, MEInterface):
     """Integrator solving the Lindblad master equation with Diffrax."""
 
+    @property
+    def args(self) -> PyTree:
+        return self.H, self.Ls
+
     @property
     def terms(self) -> dx.AbstractTerm:
         # define Lindblad term drho/dt
@@ -233,8 +381,9 @@ class MEDiffraxIntegrator(DiffraxIntegrator, MEInterface):
         # and is thus more efficient numerically with only a negligible numerical error
         # induced on the dynamics.
 
-        def vector_field(t, y, _):  # noqa: ANN001, ANN202
-            L, H = self.L(t), self.H(t)
+        def vector_field(t, y, args):  # noqa: ANN001, ANN202
+            H, Ls = args
+            L, H = [_L(t) for _L in Ls], H(t)
             Hnh = -1j * H + sum([-0.5 * _L.dag() @ _L for _L in L])
             tmp = Hnh @ y + sum([0.5 * _L @ y @ _L.dag() for _L in L])
             return tmp + tmp.dag()
@@ -280,8 +429,9 @@ class MEPropagatorDiffraxIntegrator(
         # define vector field for Lindblad equation in superoperator form
         # drho/dt = \mathcal{L}(\rho)
 
-        def vector_field(t, y, _):  # noqa: ANN001, ANN202
-            L, H = self.L(t), self.H(t)
+        def vector_field(t, y, args):  # noqa: ANN001, ANN202
+            H, Ls = args
+            L, H = [_L(t) for _L in Ls], H(t)
             return slindbladian(H, L) @ y
 
         return dx.ODETerm(vector_field)
@@ -13,7 +13,13 @@ from jaxtyping import PRNGKeyArray, PyTree, Scalar
 from ...qarrays.qarray import QArray
 from ...qarrays.utils import stack
 from ...result import Result
-from ...utils.general import dag, expect, norm, unit
+from ...time_qarray import (
+    ConstantTimeQArray,
+    ModulatedTimeQArray,
+    PWCTimeQArray,
+    TimeQArray,
+)
+from ...utils.general import norm, unit
 from .abstract_integrator import StochasticBaseIntegrator
 from .diffrax_integrator import DiffraxIntegrator
 from .interfaces import JSSEInterface, SolveInterface
@@ -34,6 +40,15 @@ class JSSEState(eqx.Module):
     inner_state: JSSEInnerState  # saved quantities
 
 
+def _is_constant(x: TimeQArray) -> bool:
+    return isinstance(x, ConstantTimeQArray)
+
+
+def _is_prefactor(x: TimeQArray) -> bool:
+    # time-qarrays of the form `f(t) * qarray` with a scalar prefactor `f(t)`
+    return isinstance(x, (PWCTimeQArray, ModulatedTimeQArray))
+
+
 def save_buffers(inner_state: JSSEInnerState) -> PyTree:
     assert type(inner_state) is JSSEInnerState
     return inner_state.saved
@@ -53,17 +68,38 @@ class JSSESolveEventIntegrator(
 ):
     """Integrator computing the time evolution of the Jump SSE using Diffrax events."""
 
-    noclick: bool
     noclick_min_prob: float
 
     @property
     def terms(self) -> dx.AbstractTerm:
+        # the operators `Ld @ L` are computed once here rather than at every vector
+        # field evaluation: for a constant jump operator they are summed into a single
+        # constant operator, and for a jump operator `f(t) * L` only the scalar
+        # prefactor `|f(t)|^2` of `Ld @ L` is evaluated at runtime
+        LdL_const = [L.qarray.dag() @ L.qarray for L in self.Ls if _is_constant(L)]
+        LdL_const = -0.5 * sum(LdL_const) if len(LdL_const) > 0 else None
+        Ls_prefactor = [L for L in self.Ls if _is_prefactor(L)]
+        LdL_prefactor = [-0.5 * L.qarray.dag() @ L.qarray for L in Ls_prefactor]
+        Ls_other = [L for L in self.Ls if not (_is_constant(L) or _is_prefactor(L))]
+
         def vector_field(t, y, _):  # noqa: ANN001, ANN202
-            L, H = self.L(t), self.H(t)
-            return -1j * H @ y + sum([-0.5 * _L.dag() @ (_L @ y) for _L in L])
+            dy = -1j * self.H(t) @ y
+            if LdL_const is not None:
+                dy += LdL_const @ y
+            for L, LdL in zip(Ls_prefactor, LdL_prefactor, strict=True):
+                dy += jnp.abs(L.prefactor(t)) ** 2 * (LdL @ y)
+            for _L in [L(t) for L in Ls_other]:
+                dy += -0.5 * _L.dag() @ (_L @ y)
+            return dy
 
         return dx.ODETerm(vector_field)
 
+    @property
+    def args(self) -> PyTree:
+        # the vector field closes over the operators, this is fine since the
+        # continuous adjoint method is not supported with events
+        return None
+
     def run(self) -> Result:
         def loop_condition(state: JSSEState) -> bool:
             return state.t < self.t1
@@ -71,11 +107,8 @@ class JSSESolveEventIntegrator(
         def loop_body(state: JSSEState) -> JSSEState:
             # pick a random number for the next detection event
             key, click_key, jump_key = jax.random.split(state.key, num=3)
-            if self.noclick:
-                rand = 0.0
-            else:
-                minval = jnp.where(state.nclicks > 0, 0.0, self.noclick_min_prob)
-                rand = jax.random.uniform(click_key, minval=minval)
+            minval = jnp.where(state.nclicks > 0, 0.0, self.noclick_min_prob)
+            rand = jax.random.uniform(click_key, minval=minval)
 
             # solve until the next detection event
             solution = self._solve_until_click(state.y, state.t, rand)
@@ -89,8 +122,8 @@ class JSSESolveEventIntegrator(
                 yclick: QArray, clicktimes: Array, nclicks: int
             ) -> tuple[QArray, Array, int]:
                 # find a random jump operator among the provided jump_ops, and apply it
-                jump_op, idx = self._sample_jump_ops(tclick, yclick, jump_key)
-                yclick = unit(jump_op @ yclick)
+                psi_jump, idx = self._sample_jump(tclick, yclick, jump_key)
+                yclick = unit(psi_jump)
 
                 # update clicktimes
                 clicktimes = clicktimes.at[idx, state.nclicks].set(tclick)
@@ -115,6 +148,8 @@ class JSSESolveEventIntegrator(
             # save intermediate states and expectation values, based on the code
             # in diffrax/_integrate.py which can be found at:
             # https://github.com/patrick-kidger/diffrax/blob/main/diffrax/_integrate.py#L427-L458
+            # only the save indices reached since the last detection event are
+            # written, such that each index is written once over the whole trajectory
             def save_cond(inner_state: JSSEInnerState) -> bool:
                 save_index = inner_state.save_index
                 return (self.ts[save_index] <= tclick) & (save_index < len(self.ts))
@@ -164,6 +199,20 @@ class JSSESolveEventIntegrator(
         saved = self.postprocess_saved(saved, final_state.y, clicktimes)
         return self.result(saved, infos=None)
 
+    def run_noclick(self) -> Result:
+        # the no-click trajectory never triggers a detection event, so it is integrated
+        # in a single solve to the final time, saving at all save times
+        fn = lambda t, y, args: self.save(y)  # noqa: ARG005
+        subsaveat_a = dx.SubSaveAt(ts=self.ts, fn=fn)  # save solution regularly
+        subsaveat_b = dx.SubSaveAt(t1=True)  # save last state
+        saveat = dx.SaveAt(subs=[subsaveat_a, subsaveat_b])
+        solution = self.diffeqsolve(self.t0, self.t1, self.y0, saveat)
+
+        # collect and return results
+        clicktimes = jnp.full((len(self.Ls), self.options.nmaxclick), jnp.nan)
+        saved = self.postprocess_saved(solution.ys[0], solution.ys[1][0], clicktimes)
+        return self.result(saved, infos=None)
+
     def _solve_until_click(self, y0: QArray, t0: Array, rand: Array) -> dx.Solution:
         # === prepare saveat
         fn = lambda t, y, args: self.save(y)  # noqa: ARG005
@@ -181,22 +230,25 @@ class JSSESolveEventIntegrator(
         # === solve differential equation with diffrax
         return self.diffeqsolve(t0=t0, t1=self.t1, y0=y0, saveat=saveat, event=event)
 
-    def _sample_jump_ops(self, t: Array, psi: Array, key: Array) -> tuple[Array, int]:
+    def _sample_jump(self, t: Array, psi: QArray, key: Array) -> tuple[QArray, int]:
         # given a state psi at time t that should experience a jump,
-        # randomly sample one jump operator from among the provided jump_ops.
+        # randomly sample one jump operator from among the provided jump_ops, and
+        # return the (unnormalized) jumped state L @ psi.
         # The probability that a certain jump operator is selected is weighted
         # by the probability that such a jump can occur. For instance for a qubit
         # experiencing amplitude damping, if it is in the ground state then
         # there is probability zero of experiencing an amplitude damping event.
 
-        Ls = stack([L(t) for L in self.Ls])
-        Lsd = dag(Ls)
-        probs = expect(Lsd @ Ls, psi)
+        # all jumped states are computed at once in a single stacked array of shape
+        # (nLs, n, 1), from which both the jump probabilities <psi|Ld @ L|psi> and
+        # the sampled jumped state are read
+        Ls_psi = stack([L(t) @ psi for L in self.Ls])
+        probs = norm(Ls_psi) ** 2
         # for categorical we pass in the log of the probabilities
-        logits = jnp.log(jnp.real(probs / (jnp.sum(probs))))
+        logits = jnp.log(probs / jnp.sum(probs))
         # randomly sample the index of a single jump operator
         sample_idx = jax.random.categorical(key, logits, shape=(1,))[0]
-        return Ls[sample_idx], sample_idx
+        return Ls_psi[sample_idx], sample_idx
 
 
 jssesolve_event_euler_integrator_constructor = partial(
@@ -5,12 +5,15 @@ from abc import abstractmethod
 import equinox as eqx
 import jax
 import jax.numpy as jnp
+from equinox.internal import while_loop
 from jax import Array
 from jaxtyping import PyTree
 
 from dynamiqs._utils import concatenate_sort
 
+from ...gradient import ForwardAutograd
 from ...qarrays.qarray import QArray
+from ...qarrays.sparsedia_qarray import SparseDIAQArray
 from ...result import Result, Saved
 from ...utils.general import expm
 from ...utils.vectorization import operator_to_vector, slindbladian, vector_to_operator
@@ -57,12 +60,13 @@ class ExpmIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface):
         pass
 
     def run(self) -> Result:
+        # for a constant generator, the solution at all save times can be evaluated at
+        # once from the generator eigendecomposition
+        if self.method.spectral and len(self.discontinuity_ts) == 0:
+            return self._run_spectral()
+
         # === find all times at which to stop in [t0, t1]
-        # find all times where the solution should be saved (self.ts) or at which the
-        # generator changes (self.discontinuity_ts)
-        disc_ts = self.discontinuity_ts
-        disc_ts = disc_ts.clip(self.t0, self.t1)
-        times = concatenate_sort(jnp.asarray([self.t0]), self.ts, disc_ts)  # (ntimes,)
+        times = self._stop_times()  # (ntimes,)
 
         # === compute time differences (null for times outside [t0, t1])
         delta_ts = jnp.diff(times)  # (ntimes-1,)
@@ -91,6 +95,161 @@ class ExpmIntegrator(BaseIntegrator, AbstractSaveMixin, AbstractTimeInterface):
         nsteps = (delta_ts != 0).sum()
         return self.result(saved, infos=self.Infos(nsteps))
 
+    def _stop_times(self) -> Array:
+        # find all times where the solution should be saved (self.ts) or at which the
+        # generator changes (self.discontinuity_ts)
+        disc_ts = self.discontinuity_ts
+        disc_ts = disc_ts.clip(self.t0, self.t1)
+        return concatenate_sort(jnp.asarray([self.t0]), self.ts, disc_ts)
+
+    def _run_spectral(self) -> Result:
+        # === evolve the initial state to all save times
+        A = self.generator(self.t0).to_jax()  # (N, N)
+        y0 = self.y0.asdense()
+        ysave = _spectral_propagate(A, y0.to_jax(), self.ts - self.t0)  # (nts, N, M)
+        ysave = y0._replace(data=ysave)
+
+        # === save the states or propagators
+        saved = jax.vmap(self.save)(ysave)
+        saved = self.postprocess_saved(saved, ysave[-1][None])
+
+        nsteps = (jnp.diff(self.ts, prepend=self.t0) != 0).sum()
+        return self.result(saved, infos=self.Infos(nsteps))
+
+
+@jax.custom_jvp
+def _spectral_propagate(A: Array, y0: Array, dts: Array) -> Array:
+    # compute e^{dt A} @ y0 for all times dt in dts, using the eigendecomposition
+    # A = R @ diag(lambdas) @ R^{-1} such that
+    # e^{dt A} = R @ diag(e^{dt lambdas}) @ R^{-1}
+    # A: (N, N), y0: (N, M), dts: (ndts,) -> (ndts, N, M)
+    lambdas, R = jnp.linalg.eig(A)
+    c = jnp.linalg.solve(R, y0.astype(R.dtype))  # (N, M)
+    return R @ (jnp.exp(dts[:, None, None] * lambdas[:, None]) * c)
+
+
+@_spectral_propagate.defjvp
+def _spectral_propagate_jvp(
+    primals: tuple[Array, Array, Array], tangents: tuple[Array, Array, Array]
+) -> tuple[Array, Array]:
+    # JAX does not implement the derivative of eigenvectors, so the derivative of the
+    # matrix exponential is instead computed from the Daleckii-Krein formula
+    # d(e^{dt A}) = R @ ((R^{-1} @ dA @ R) * G) @ R^{-1} with the divided differences
+    # G_ij = (e^{dt lambdas_i} - e^{dt lambdas_j}) / (lambdas_i - lambdas_j)
+    A, y0, dts = primals
+    dA, dy0, ddts = tangents
+    lambdas, R = jnp.linalg.eig(A)
+    Rinv = jnp.linalg.inv(R)
+    c = Rinv @ y0.astype(R.dtype)  # (N, M)
+    exp_lambdas = jnp.exp(dts[:, None] * lambdas)  # (ndts, N)
+    ys = R @ (exp_lambdas[..., None] * c)  # (ndts, N, M)
+
+    # G_ij = dt e^{dt lambdas_j} (e^z - 1) / z with z = dt (lambdas_i - lambdas_j),
+    # G being symmetric the indices are swapped when Re(z) > 0 to avoid overflows
+    z = dts[:, None, None] * (lambdas[:, None] - lambdas[None, :])  # (ndts, N, N)
+    swap = z.real > 0
+    exp_max = jnp.where(swap, exp_lambdas[:, :, None], exp_lambdas[:, None, :])
+    G = dts[:, None, None] * exp_max * _expm1_ratio(jnp.where(swap, -z, z))
+
+    dA_eig = Rinv @ dA.astype(R.dtype) @ R  # (N, N)
+    dc = Rinv @ dy0.astype(R.dtype)  # (N, M)
+    dys = R @ ((G * dA_eig) @ c + exp_lambdas[..., None] * dc)  # (ndts, N, M)
+    dys = dys + ddts[:, None, None] * (A @ ys)
+    return ys, dys
+
+
+def _expm1_ratio(z: Array) -> Array:
+    # (e^z - 1) / z, continuously extended by its Taylor expansion around z = 0
+    small = jnp.abs(z) < 1e-4
+    z_safe = jnp.where(small, 1.0, z)
+    return jnp.where(small, 1.0 + z / 2, jnp.expm1(z_safe) / z_safe)
+
+
+class MatrixFormExpmIntegrator(ExpmIntegrator):
+    r"""Integrator solving a linear ODE of the form $dX/dt = A(X)$ by applying the
+    propagator exponential directly to the state.
+
+    The generator $A$ is never built as a matrix: on each time interval $\Delta t$,
+    $e^{\Delta t A}(X)$ is computed as a sequence of substeps $h$ with
+    $\|hA\|\leq1$, each evaluated by a truncated Taylor series whose terms only
+    involve the action of $A$ on the state. This action only requires products with
+    the Hamiltonian and jump operators, which remain sparse if they are sparse.
+    """
+
+    @abstractmethod
+    def generator_action(self, t: float) -> tuple[callable[[QArray], QArray], Array]:
+        # returns the action X -> A(X) of the generator at time t, and an upper bound
+        # of the norm of A
+        pass
+
+    def run(self) -> Result:
+        # === find all times at which to stop in [t0, t1]
+        times = self._stop_times()  # (ntimes,)
+
+        # === compute time differences (null for times outside [t0, t1])
+        delta_ts = jnp.diff(times)  # (ntimes-1,)
+
+        # === iteratively apply the propagators on each time interval
+        def step(carry: QArray, x: tuple[Array, Array]) -> tuple[QArray, PyTree]:
+            y, nsubsteps = self._expm_multiply(*x, carry)
+            return y, (self.save(y), nsubsteps)
+
+        ylast, (saved, nsubsteps) = jax.lax.scan(step, self.y0, (times[:-1], delta_ts))
+
+        # === save the states
+        # extract states at the save times ts
+        t_idxs = jnp.searchsorted(times[1:], self.ts)  # (nts,)
+        saved = jax.tree.map(lambda x: x[t_idxs], saved)
+
+        saved = self.postprocess_saved(saved, ylast[None])
+
+        nsteps = nsubsteps.sum()
+        return self.result(saved, infos=self.Infos(nsteps))
+
+    def _expm_multiply(
+        self, t: Array, delta_t: Array, y: QArray
+    ) -> tuple[QArray, Array]:
+        action, bound = self.generator_action(t)
+
+        # choose the number of substeps such that ||h A|| <= 1 for each substep of
+        # duration h
+        nsubsteps = jnp.ceil(delta_t * jax.lax.stop_gradient(bound)).astype(int)
+        h = delta_t / jnp.maximum(nsubsteps, 1)
+
+        # Taylor series truncation order, such that the remainder of the series is
+        # below the floating point precision
+        order = 18 if y.dtype == jnp.complex128 else 12
+
+        def substep(carry: tuple[Array, QArray]) -> tuple[Array, QArray]:
+            i, y = carry
+
+            def taylor_term(k: int, x: tuple[QArray, QArray]) -> tuple[QArray, QArray]:
+                term, y_next = x
+                term = (h / k) * action(term)
+                return term, y_next + term
+
+            _, y = jax.lax.fori_loop(1, order + 1, taylor_term, (y, y))
+            return i + 1, y
+
+        # the number of substeps is not known at compile time, the loop is only
+        # reverse-mode differentiable when checkpointed, in which case at most 100
+        # intermediate states are stored and the others are recomputed
+        cond_fun = lambda carry: carry[0] < nsubsteps
+        if self.gradient is None or isinstance(self.gradient, ForwardAutograd):
+            _, y = while_loop(cond_fun, substep, (0, y), kind='lax')
+        else:
+            _, y = while_loop(
+                cond_fun, substep, (0, y), kind='checkpointed', checkpoints=100
+            )
+        return y, nsubsteps
+
+
+def _fro_norm(x: QArray) -> Array:
+    # the diagonals of a sparse qarray contain zeros outside the matrix bounds, so its
+    # norm is computed without converting it to a dense qarray
+    data = x.diags if isinstance(x, SparseDIAQArray) else x.to_jax()
+    return jnp.sqrt((jnp.abs(data) ** 2).sum((-2, -1)))
+
 
 class SEExpmIntegrator(ExpmIntegrator, SEInterface):
     """Integrator solving the Schrödinger equation by explicitly exponentiating the
@@ -114,7 +273,22 @@ class SESolveExpmIntegrator(SEExpmIntegrator, SolveSaveMixin, SolveInterface):
     """
 
 
-sesolve_expm_integrator_constructor = SESolveExpmIntegrator
+class SESolveMatrixFormExpmIntegrator(
+    MatrixFormExpmIntegrator, SEExpmIntegrator, SolveSaveMixin, SolveInterface
+):
+    """Integrator computing the time evolution of the Schrödinger equation by
+    applying the propagator exponential directly to the state.
+    """
+
+    def generator_action(self, t: float) -> tuple[callable[[QArray], QArray], Array]:
+        A = self.generator(t)
+        return lambda psi: A @ psi, _fro_norm(A)
+
+
+def sesolve_expm_integrator_constructor(**kwargs) -> SEExpmIntegrator:
+    if kwargs['method'].matrix_form:
+        return SESolveMatrixFormExpmIntegrator(**kwargs)
+    return SESolveExpmIntegrator(**kwargs)
 
 
 class SEPropagatorExpmIntegrator(SEExpmIntegrator, PropagatorSaveMixin):
@@ -164,7 +338,33 @@ class MESolveExpmIntegrator(MEExpmIntegrator, SolveSaveMixin, SolveInterface):
         return super().save(y)
 
 
-mesolve_expm_integrator_constructor = MESolveExpmIntegrator
+class MESolveMatrixFormExpmIntegrator(
+    MatrixFormExpmIntegrator, MEExpmIntegrator, SolveSaveMixin, SolveInterface
+):
+    """Integrator computing the time evolution of the Lindblad master equation by
+    applying the propagator exponential directly to the density matrix, without
+    building the Liouvillian superoperator.
+    """
+
+    def generator_action(self, t: float) -> tuple[callable[[QArray], QArray], Array]:
+        H, L = self.H(t), self.L(t)
+        Hnh = -1j * H + sum([-0.5 * _L.dag() @ _L for _L in L])
+
+        def lindbladian(rho: QArray) -> QArray:
+            # same as the diffrax integrator vector field, see the comment in
+            # `MEDiffraxIntegrator.terms`
+            tmp = Hnh @ rho + sum([0.5 * _L @ rho @ _L.dag() for _L in L])
+            return tmp + tmp.dag()
+
+        # upper bound ||L|| <= 2 ||Hnh|| + sum_k ||L_k||^2
+        bound = 2 * _fro_norm(Hnh) + sum([_fro_norm(_L) ** 2 for _L in L])
+        return lindbladian, bound
+
+
+def mesolve_expm_integrator_constructor(**kwargs) -> MEExpmIntegrator:
+    if kwargs['method'].matrix_form:
+        return MESolveMatrixFormExpmIntegrator(**kwargs)
+    return MESolveExpmIntegrator(**kwargs)
 
 
 class MEPropagatorExpmIntegrator(MEExpmIntegrator, PropagatorSaveMixin):
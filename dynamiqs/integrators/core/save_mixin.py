@@ -6,6 +6,7 @@ import equinox as eqx
 import jax.numpy as jnp
 from jaxtyping import Array, PyTree
 
+from ...qarrays.qarray import QArray
 from ...result import (
     DiffusiveSolveSaved,
     JumpSolveSaved,
@@ -53,10 +54,13 @@ class SolveSaveMixin(AbstractSaveMixin):
     def save(self, y: PyTree) -> Saved:
         ysave = y if self.options.save_states else None
         extra = self.options.save_extra(y) if self.options.save_extra else None
-        if self.Es is not None:
-            Esave = jnp.stack([expect(E, y) for E in self.Es])
-        else:
+        if self.Es is None:
             Esave = None
+        elif isinstance(self.Es, QArray):
+            # operators stacked in a single qarray are all computed at once
+            Esave = expect(self.Es, y)
+        else:
+            Esave = jnp.stack([expect(E, y) for E in self.Es])
         return SolveSaved(ysave, extra, Esave)
 
     def reorder_Esave(self, saved: Saved) -> Saved:
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from typing import ClassVar
 
 import equinox as eqx
 from optimistix import AbstractRootFinder
 
 from ._utils import tree_str_inline
-from .gradient import Autograd, CheckpointAutograd, ForwardAutograd, Gradient
+from .gradient import (
+    Autograd,
+    BacksolveAutograd,
+    CheckpointAutograd,
+    ForwardAutograd,
+    Gradient,
+)
 
 __all__ = [
     'Dopri5',
@@ -76,26 +82,55 @@ class Expm(Method):
 
     Warning:
         If the Hamiltonian or jump operators are sparse qarrays, they will be silently
-        converted to dense qarrays before computing their matrix exponentials.
+        converted to dense qarrays before computing their matrix exponentials, unless
+        `matrix_form=True` for [`dq.sesolve()`][dynamiqs.sesolve] and
+        [`dq.mesolve()`][dynamiqs.mesolve].
 
     Warning:
         This method is not recommended for open systems of large dimension, due to
-        the $\mathcal{O}(n^6)$ scaling of computing the Liouvillian exponential.
+        the $\mathcal{O}(n^6)$ scaling of computing the Liouvillian exponential, unless
+        `matrix_form=True` for [`dq.mesolve()`][dynamiqs.mesolve].
 
     Warning:
         This method only supports constant or piecewise constant Hamiltonian and jump
         operators.
 
+    Args:
+        spectral: If `True`, for constant Hamiltonian and jump operators, the generator
+            is diagonalized once and the solution at all times in `tsave` is
+            evaluated from its eigendecomposition, instead of computing one matrix
+            exponential per time interval. This is much faster for many save times,
+            but inaccurate if the generator is not diagonalizable or has
+            ill-conditioned eigenvectors. Piecewise constant problems always use
+            matrix exponentials.
+        matrix_form: If `True`, for [`dq.sesolve()`][dynamiqs.sesolve] and
+            [`dq.mesolve()`][dynamiqs.mesolve], the propagator is never built: its
+            exponential is directly applied to the state, using only products with the
+            Hamiltonian and jump operators, which remain sparse if they are sparse
+            qarrays. For [`dq.mesolve()`][dynamiqs.mesolve], the $n^2\times n^2$
+            Liouvillian is thus never built, which is much faster for open systems of
+            large dimension. Cannot be combined with `spectral`.
+
     Note-: Supported gradients
         This method supports differentiation with
-        [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd] (default).
+        [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd] (default)
+        and [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd].
     """
 
-    SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (Autograd,)
+    SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (Autograd, ForwardAutograd)
+
+    spectral: bool = eqx.field(static=True, default=False)
+    matrix_form: bool = eqx.field(static=True, default=False)
 
     # dummy init to have the signature in the documentation
-    def __init__(self):
-        pass
+    def __init__(self, spectral: bool = False, matrix_form: bool = False):
+        if spectral and matrix_form:
+            raise ValueError(
+                'Arguments `spectral` and `matrix_form` of method `Expm` cannot both'
+                ' be `True`.'
+            )
+        self.spectral = spectral
+        self.matrix_form = matrix_form
 
 
 # === generic ODE/SDE methods options
@@ -128,6 +163,10 @@ class Euler(_DEFixedStep):
 
     Args:
         dt: Fixed time step.
+        use_scan: If `True`, Diffrax is bypassed and the fixed steps are directly
+            iterated in a JAX loop between consecutive save times. This removes the
+            per-step overhead of Diffrax, which dominates for small problems with many
+            steps. The progress meter is not supported in this mode.
 
     Note-: Supported gradients
         This method supports differentiation with
@@ -143,9 +182,12 @@ class Euler(_DEFixedStep):
         ForwardAutograd,
     )
 
+    use_scan: bool = eqx.field(static=True, default=False)
+
     # dummy init to have the signature in the documentation
-    def __init__(self, dt: float):
+    def __init__(self, dt: float, use_scan: bool = False):
         super().__init__(dt)
+        self.use_scan = use_scan
 
 
 class EulerMaruyama(_DEFixedStep):
@@ -159,10 +201,11 @@ class EulerMaruyama(_DEFixedStep):
 
     Note-: Supported gradients
         This method supports differentiation with
-        [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd] (default).
+        [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd] (default)
+        and [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd].
     """
 
-    SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (Autograd,)
+    SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (Autograd, ForwardAutograd)
 
     # todo: fix static dt (similar issue as static tsave in dssesolve)
     dt: float = eqx.field(static=True)
@@ -369,14 +412,16 @@ class Kvaerno3(_DEAdaptiveStep):
         This method supports differentiation with
         [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd],
         [`dq.gradient.CheckpointAutograd`][dynamiqs.gradient.CheckpointAutograd]
-        (default)
-        and [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd].
+        (default),
+        [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd]
+        and [`dq.gradient.BacksolveAutograd`][dynamiqs.gradient.BacksolveAutograd].
     """
 
     SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (
         Autograd,
         CheckpointAutograd,
         ForwardAutograd,
+        BacksolveAutograd,
     )
 
     # dummy init to have the signature in the documentation
@@ -421,14 +466,16 @@ class Kvaerno5(_DEAdaptiveStep):
         This method supports differentiation with
         [`dq.gradient.Autograd`][dynamiqs.gradient.Autograd],
         [`dq.gradient.CheckpointAutograd`][dynamiqs.gradient.CheckpointAutograd]
-        (default)
-        and [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd].
+        (default),
+        [`dq.gradient.ForwardAutograd`][dynamiqs.gradient.ForwardAutograd]
+        and [`dq.gradient.BacksolveAutograd`][dynamiqs.gradient.BacksolveAutograd].
     """
 
     SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (
         Autograd,
         CheckpointAutograd,
         ForwardAutograd,
+        BacksolveAutograd,
     )
 
     # dummy init to have the signature in the documentation
@@ -502,6 +549,31 @@ class Event(_DEMethod):
         self.root_finder = root_finder
         self.smart_sampling = smart_sampling
 
-    # inherit attributes from the noclick_method
-    def __getattr__(self, attr: str) -> Any:
-        return getattr(self.noclick_method, attr)
+    # forward the attributes of the noclick_method read by the integrators
+    @property
+    def dt(self) -> float:
+        return self.noclick_method.dt
+
+    @property
+    def rtol(self) -> float:
+        return self.noclick_method.rtol
+
+    @property
+    def atol(self) -> float:
+        return self.noclick_method.atol
+
+    @property
+    def safety_factor(self) -> float:
+        return self.noclick_method.safety_factor
+
+    @property
+    def min_factor(self) -> float:
+        return self.noclick_method.min_factor
+
+    @property
+    def max_factor(self) -> float:
+        return self.noclick_method.max_factor
+
+    @property
+    def max_steps(self) -> int:
+        return self.noclick_method.max_steps
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 import equinox as eqx
 import jax.tree_util as jtu
 from jaxtyping import PyTree, ScalarLike
@@ -20,6 +22,10 @@ class Options(eqx.Module):
     t0: ScalarLike | None = None
     save_extra: callable[[QArray], PyTree] | None = None
     nmaxclick: int = 10_000
+    device_sharding: bool = False
+    matmul_precision: Literal['low', 'high', 'highest'] | None = eqx.field(
+        static=True, default=None
+    )
 
     def __init__(
         self,
@@ -30,6 +36,8 @@ class Options(eqx.Module):
         t0: ScalarLike | None = None,
         save_extra: callable[[QArray], PyTree] | None = None,
         nmaxclick: int = 10_000,
+        device_sharding: bool = False,
+        matmul_precision: Literal['low', 'high', 'highest'] | None = None,
     ):
         self.save_states = save_states
         self.save_propagators = save_propagators
@@ -37,6 +45,8 @@ class Options(eqx.Module):
         self.progress_meter = progress_meter
         self.t0 = t0
         self.nmaxclick = nmaxclick
+        self.device_sharding = device_sharding
+        self.matmul_precision = matmul_precision
 
         # make `save_extra` a valid Pytree with `Partial`
         self.save_extra = jtu.Partial(save_extra) if save_extra is not None else None
@@ -64,6 +74,8 @@ class Options(eqx.Module):
             t0=self.t0,
             save_extra=self.save_extra,
             nmaxclick=self.nmaxclick,
+            device_sharding=self.device_sharding,
+            matmul_precision=self.matmul_precision,
         )
 
 
@@ -75,6 +87,7 @@ def check_options(options: Options, solver_name: str):
             'progress_meter',
             't0',
             'save_extra',
+            'matmul_precision',
         ),
         'mesolve': (
             'save_states',
@@ -82,6 +95,7 @@ def check_options(options: Options, solver_name: str):
             'progress_meter',
             't0',
             'save_extra',
+            'matmul_precision',
         ),
         'sepropagator': ('save_propagators', 'progress_meter', 't0', 'save_extra'),
         'mepropagator': ('save_propagators', 'cartesian_batching', 't0', 'save_extra'),
@@ -92,6 +106,8 @@ def check_options(options: Options, solver_name: str):
             't0',
             'save_extra',
             'nmaxclick',
+            'device_sharding',
+            'matmul_precision',
         ),
         'dssesolve': ('save_states', 'cartesian_batching', 'save_extra'),
         'jsmesolve': ('save_states', 'cartesian_batching', 'save_extra', 'nmaxclick'),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
 from typing import Literal
 
 import jax
@@ -93,12 +94,18 @@ def set_matmul_precision(matmul_precision: Literal['low', 'high', 'highest']):
         matmul_precision _(string 'low', 'high', or 'highest')_: Default precision
             for matrix multiplications on GPUs and TPUs.
     """
+    jax_matmul_precision = _jax_matmul_precision(matmul_precision)
+    jax.config.update('jax_default_matmul_precision', jax_matmul_precision)
+
+
+def _jax_matmul_precision(matmul_precision: Literal['low', 'high', 'highest']) -> str:
+    # convert a dynamiqs matmul precision to the corresponding JAX precision
     if matmul_precision == 'low':
-        jax.config.update('jax_default_matmul_precision', 'fastest')
+        return 'bfloat16'
     elif matmul_precision == 'high':
-        jax.config.update('jax_default_matmul_precision', 'high')
+        return 'high'
     elif matmul_precision == 'highest':
-        jax.config.update('jax_default_matmul_precision', 'highest')
+        return 'highest'
     else:
         raise ValueError(
             f"Argument `matmul_precision` should be a string 'low', 'high', or"
@@ -106,6 +113,16 @@ def set_matmul_precision(matmul_precision: Literal['low', 'high', 'highest']):
         )
 
 
+def _matmul_precision_context(
+    matmul_precision: Literal['low', 'high', 'highest'] | None,
+) -> AbstractContextManager:
+    # context setting the matmul precision of a single call, the global precision set
+    # with `dq.set_matmul_precision()` is left untouched if `matmul_precision` is None
+    if matmul_precision is None:
+        return nullcontext()
+    return jax.default_matmul_precision(_jax_matmul_precision(matmul_precision))
+
+
 def set_layout(layout: Literal['dense', 'dia']):
     """Configure the default matrix layout for operators supporting this option.
 
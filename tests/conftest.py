@@ -1,9 +1,33 @@
+import os
+
+import jax
 import matplotlib
 import pytest
 
 from .order import TEST_INSTANT
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--jax-cache',
+        action='store_true',
+        help=(
+            'persist compiled XLA executables across test runs, in the directory'
+            ' given by the JAX_CACHE_DIR environment variable (default: .jax_cache)'
+        ),
+    )
+
+
+def pytest_configure(config):
+    # opt-in, such that default test runs stay hermetic
+    if config.getoption('--jax-cache'):
+        cache_dir = os.environ.get('JAX_CACHE_DIR', '.jax_cache')
+        jax.config.update('jax_compilation_cache_dir', cache_dir)
+        # cache all executables, the unit tests mostly compile small ones
+        jax.config.update('jax_persistent_cache_min_entry_size_bytes', 0)
+        jax.config.update('jax_persistent_cache_min_compile_time_secs', 0)
+
+
 @pytest.fixture(scope='session', autouse=True)
 def mpl_backend():
     # use a non-interactive backend for matplotlib, to avoid opening a display window
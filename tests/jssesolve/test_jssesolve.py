@@ -74,3 +74,133 @@ def test_against_mesolve_qubit(smart_sampling, atol=1e-2):
     assert jnp.allclose(
         meresult.states.to_jax(), jsseresult.mean_states.to_jax(), atol=atol
     )
+
+
+@pytest.mark.skipif(
+    jax.device_count() == 1,
+    reason='requires several devices, e.g. with the XLA flag'
+    ' `--xla_force_host_platform_device_count=4` on CPU',
+)
+@pytest.mark.parametrize('smart_sampling', [True, False])
+def test_device_sharding(smart_sampling):
+    # solver inputs
+    a = dq.destroy(4)
+    H = a.dag() @ a
+    jump_ops = [a, 0.3 * a.dag() @ a]
+    psi0 = dq.coherent(4, 1.0)
+    tsave = jnp.linspace(0.0, 1.0, 5)
+    # with smart sampling, the first key is consumed by the no-click trajectory
+    ntrajs = 2 * jax.device_count() + smart_sampling
+    keys = jax.random.split(jax.random.key(42), num=ntrajs)
+    method = dq.method.Event(smart_sampling=smart_sampling)
+
+    # solve with and without sharding trajectories across devices
+    result = dq.jssesolve(H, jump_ops, psi0, tsave, keys, method=method)
+    options = dq.Options(device_sharding=True)
+    sharded_result = dq.jssesolve(
+        H, jump_ops, psi0, tsave, keys, method=method, options=options
+    )
+
+    # compare results
+    assert jnp.allclose(result.states.to_jax(), sharded_result.states.to_jax())
+    assert jnp.allclose(result.clicktimes, sharded_result.clicktimes, equal_nan=True)
+
+
+def _traced_matmul_precisions(f) -> set[str | None]:
+    # precisions of the matrix multiplications traced when calling `f`, `None` if the
+    # precision is not set
+    def visit(jaxpr) -> set[str | None]:
+        precisions = set()
+        for eqn in jaxpr.eqns:
+            if eqn.primitive.name == 'dot_general':
+                precision = eqn.params['precision']
+                precisions.add(None if precision is None else precision[0].name)
+            # recurse into the sub-jaxprs of control flow and jitted functions
+            for param in eqn.params.values():
+                for x in param if isinstance(param, (tuple, list)) else [param]:
+                    if hasattr(x, 'eqns'):
+                        precisions |= visit(x)
+                    elif hasattr(x, 'jaxpr'):
+                        precisions |= visit(x.jaxpr)
+        return precisions
+
+    return visit(jax.make_jaxpr(f)().jaxpr)
+
+
+def test_matmul_precision():
+    # solver inputs, in the dense layout such that the operator products are matrix
+    # multiplications
+    a = dq.destroy(4, layout=dq.dense)
+    H = a.dag() @ a
+    jump_ops = [a]
+    psi0 = dq.coherent(4, 1.0)
+    tsave = jnp.linspace(0.0, 1.0, 5)
+    keys = jax.random.split(jax.random.key(42), num=4)
+
+    # without the option, the global precision set at import is used
+    precisions = _traced_matmul_precisions(
+        lambda: dq.jssesolve(H, jump_ops, psi0, tsave, keys)
+    )
+    assert precisions == {'HIGHEST'}
+
+    # with the option, the global precision is overridden (Diffrax still makes some
+    # matrix multiplications with an explicit highest precision)
+    options = dq.Options(matmul_precision='low')
+    precisions = _traced_matmul_precisions(
+        lambda: dq.jssesolve(H, jump_ops, psi0, tsave, keys, options=options)
+    )
+    assert 'DEFAULT' in precisions
+
+
+def test_layout():
+    # solver inputs, the operators are integrated in their input layout
+    def solve(layout):
+        a = dq.destroy(4, layout=layout)
+        H = dq.modulated(jnp.cos, a + a.dag()) + a.dag() @ a
+        jump_ops = [a, dq.timecallable(lambda t: t * a.dag() @ a)]
+        psi0 = dq.coherent(4, 1.0)
+        tsave = jnp.linspace(0.0, 1.0, 5)
+        keys = jax.random.split(jax.random.key(42), num=4)
+        exp_ops = [a.dag() @ a, a + a.dag()]
+        return dq.jssesolve(H, jump_ops, psi0, tsave, keys, exp_ops=exp_ops)
+
+    # solve with operators in the sparse DIA layout and in the dense layout
+    result_dia = solve(dq.dia)
+    result_dense = solve(dq.dense)
+
+    # compare results
+    assert jnp.allclose(result_dia.states.to_jax(), result_dense.states.to_jax())
+    assert jnp.allclose(result_dia.expects, result_dense.expects)
+
+
+def test_prefactor_jump_ops():
+    # solver inputs, with jump operators of the form `f(t) * L`
+    a = dq.destroy(4)
+    H = a.dag() @ a
+    times, values = jnp.array([0.0, 0.4, 1.0]), jnp.array([1.0, 0.5j])
+    f = lambda t: jnp.cos(2.0 * t)
+    jump_ops = [dq.modulated(f, a), dq.pwc(times, values, a.dag() @ a)]
+    psi0 = dq.coherent(4, 1.0)
+    tsave = jnp.linspace(0.0, 1.0, 5)
+    keys = jax.random.split(jax.random.key(42), num=4)
+
+    # solve with the precomputed `Ld @ L` operators, and with the same jump operators
+    # evaluated at every vector field evaluation (a fixed step method is used such
+    # that both vector fields are evaluated at the same times)
+    method = dq.method.Event(noclick_method=dq.method.Euler(dt=1e-3))
+    result = dq.jssesolve(H, jump_ops, psi0, tsave, keys, method=method)
+    jump_ops_callable = [
+        dq.timecallable(lambda t: f(t) * a),
+        dq.timecallable(jump_ops[1], discontinuity_ts=times),
+    ]
+    result_callable = dq.jssesolve(
+        H, jump_ops_callable, psi0, tsave, keys, method=method
+    )
+
+    # compare results
+    assert jnp.allclose(
+        result.states.to_jax(), result_callable.states.to_jax(), atol=1e-4
+    )
+    assert jnp.allclose(
+        result.clicktimes, result_callable.clicktimes, atol=1e-4, equal_nan=True
+    )
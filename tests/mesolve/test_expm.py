@@ -1,17 +1,29 @@
 import pytest
 
-from dynamiqs.gradient import Autograd
+from dynamiqs.gradient import Autograd, ForwardAutograd
 from dynamiqs.method import Expm
 
 from ..integrator_tester import IntegratorTester
 from ..order import TEST_LONG
-from .open_system import dense_ocavity
+from .open_system import dense_ocavity, dia_ocavity
+
+# sparse operators are only kept sparse with `matrix_form=True`, the other options
+# are only tested with dense operators
+cases = [
+    (dense_ocavity, Expm()),
+    (dense_ocavity, Expm(spectral=True)),
+    (dense_ocavity, Expm(matrix_form=True)),
+    (dia_ocavity, Expm(matrix_form=True)),
+]
 
 
 @pytest.mark.run(order=TEST_LONG)
 class TestMESolveExpm(IntegratorTester):
-    def test_correctness(self):
-        self._test_correctness(dense_ocavity, Expm())
+    @pytest.mark.parametrize(('system', 'method'), cases)
+    def test_correctness(self, system, method):
+        self._test_correctness(system, method)
 
-    def test_gradient(self):
-        self._test_gradient(dense_ocavity, Expm(), Autograd())
+    @pytest.mark.parametrize(('system', 'method'), cases)
+    @pytest.mark.parametrize('gradient', [Autograd(), ForwardAutograd()])
+    def test_gradient(self, system, method, gradient):
+        self._test_gradient(system, method, gradient)
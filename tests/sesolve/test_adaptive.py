@@ -1,7 +1,12 @@
 import pytest
 
-from dynamiqs.gradient import Autograd, CheckpointAutograd, ForwardAutograd
-from dynamiqs.method import Tsit5
+from dynamiqs.gradient import (
+    Autograd,
+    BacksolveAutograd,
+    CheckpointAutograd,
+    ForwardAutograd,
+)
+from dynamiqs.method import Kvaerno5, Tsit5
 
 from ..integrator_tester import IntegratorTester
 from ..order import TEST_LONG
@@ -22,3 +27,7 @@ class TestSESolveAdaptive(IntegratorTester):
     )
     def test_gradient(self, system, gradient):
         self._test_gradient(system, Tsit5(), gradient)
+
+    def test_gradient_backsolve(self):
+        # the continuous adjoint method is only supported by the Kvaerno methods
+        self._test_gradient(dense_cavity, Kvaerno5(), BacksolveAutograd())